@@ -2,7 +2,7 @@ use anyhow::{Context, Result};
 use chrono::{DateTime, Utc};
 use notify::{Event, EventKind, RecommendedWatcher, RecursiveMode, Watcher};
 use serde::{Deserialize, Serialize};
-use std::collections::VecDeque;
+use std::collections::{HashSet, VecDeque};
 use std::hash::{Hash, Hasher};
 use std::path::{Path, PathBuf};
 use std::sync::Arc;
@@ -627,13 +627,14 @@ impl ConfigManager {
     pub async fn restore_backup(&self, backup_path: impl AsRef<Path>) -> Result<()> {
         let backup_path = backup_path.as_ref();
 
-        if !backup_path.exists() {
-            return Err(anyhow::anyhow!("Backup file does not exist"));
-        }
-
-        let content = tokio::fs::read_to_string(backup_path)
-            .await
-            .context("Failed to read backup file")?;
+        // Read directly instead of stat-ing first; a missing file surfaces as NotFound
+        let content = match tokio::fs::read_to_string(backup_path).await {
+            Ok(content) => content,
+            Err(e) if e.kind() == std::io::ErrorKind::NotFound => {
+                return Err(anyhow::anyhow!("Backup file does not exist"));
+            }
+            Err(e) => return Err(e).context("Failed to read backup file"),
+        };
 
         let config: RouterConfig =
             serde_json::from_str(&content).context("Failed to parse backup configuration")?;
@@ -661,26 +662,37 @@ impl ConfigManager {
         let config = self.get_config().await;
         let backup_dir = Path::new(&config.backup.backup_directory);
 
-        if !backup_dir.exists() {
-            return Ok(Vec::new());
-        }
-
-        let mut backups = Vec::new();
-        let mut dir = tokio::fs::read_dir(backup_dir).await?;
+        let mut dir = match tokio::fs::read_dir(backup_dir).await {
+            Ok(dir) => dir,
+            Err(e) if e.kind() == std::io::ErrorKind::NotFound => return Ok(Vec::new()),
+            Err(e) => return Err(e.into()),
+        };
 
+        // One directory pass: collect backups and metadata files instead of stat-ing each pair
+        let mut backup_files = HashSet::new();
+        let mut metadata_files = Vec::new();
         while let Some(entry) = dir.next_entry().await? {
             let path = entry.path();
-            if let Some(extension) = path.extension() {
-                if extension == "meta" {
-                    let metadata_content = tokio::fs::read_to_string(&path).await?;
-                    if let Ok(metadata) = serde_json::from_str::<BackupMetadata>(&metadata_content)
-                    {
-                        let backup_path = path.with_extension("json");
-                        if backup_path.exists() {
-                            backups.push((backup_path, metadata));
-                        }
-                    }
+            match path.extension() {
+                Some(extension) if extension == "json" => {
+                    backup_files.insert(path);
                 }
+                Some(extension) if extension == "meta" => metadata_files.push(path),
+                _ => {}
+            }
+        }
+
+        let mut backups = Vec::new();
+        for path in metadata_files {
+            // "<backup>.json.meta" -> "<backup>.json"
+            let backup_path = path.with_extension("");
+            if !backup_files.contains(&backup_path) {
+                continue;
+            }
+
+            let metadata_content = tokio::fs::read_to_string(&path).await?;
+            if let Ok(metadata) = serde_json::from_str::<BackupMetadata>(&metadata_content) {
+                backups.push((backup_path, metadata));
             }
         }
 
@@ -698,9 +710,12 @@ impl ConfigManager {
 
             for (backup_path, _) in to_delete {
                 tokio::fs::remove_file(backup_path).await?;
-                let meta_path = backup_path.with_extension("meta");
-                if meta_path.exists() {
-                    tokio::fs::remove_file(meta_path).await?;
+                let mut meta_path = backup_path.clone().into_os_string();
+                meta_path.push(".meta");
+                match tokio::fs::remove_file(&meta_path).await {
+                    Ok(()) => {}
+                    Err(e) if e.kind() == std::io::ErrorKind::NotFound => {}
+                    Err(e) => return Err(e.into()),
                 }
                 log::info!("🗑️  Deleted old backup: {}", backup_path.display());
             }
@@ -770,4 +785,51 @@ mod tests {
         let restored_config = manager.get_config().await;
         assert_eq!(restored_config.router_id, config.router_id);
     }
+
+    #[tokio::test]
+    async fn test_cleanup_old_backups_prunes_backup_and_metadata() {
+        let temp_dir = tempdir().unwrap();
+        let config_path = temp_dir.path().join("config.json");
+        let backup_dir = temp_dir.path().join("backups");
+
+        let mut config = RouterConfig::default();
+        config.backup.backup_directory = backup_dir.to_string_lossy().to_string();
+        config.backup.max_backups = 1;
+
+        let config_json = serde_json::to_string_pretty(&config).unwrap();
+        tokio::fs::write(&config_path, config_json).await.unwrap();
+
+        let (manager, _) = ConfigManager::new(&config_path).await.unwrap();
+
+        // Stale backup that should be pruned along with its metadata
+        let stale_path = backup_dir.join("rust-route-backup-20000101-000000.json");
+        tokio::fs::create_dir_all(&backup_dir).await.unwrap();
+        tokio::fs::write(&stale_path, "{}").await.unwrap();
+        let stale_metadata = BackupMetadata {
+            timestamp: Utc::now() - chrono::Duration::days(1),
+            version: env!("CARGO_PKG_VERSION").to_string(),
+            size_bytes: 2,
+            checksum: String::new(),
+            description: "Stale backup".to_string(),
+            config_version: 1,
+        };
+        let stale_meta_path = backup_dir.join("rust-route-backup-20000101-000000.json.meta");
+        tokio::fs::write(
+            &stale_meta_path,
+            serde_json::to_string_pretty(&stale_metadata).unwrap(),
+        )
+        .await
+        .unwrap();
+
+        let backup_path = manager
+            .create_backup("Fresh backup".to_string())
+            .await
+            .unwrap();
+
+        let backups = manager.list_backups().await.unwrap();
+        assert_eq!(backups.len(), 1);
+        assert_eq!(backups[0].0, backup_path);
+        assert!(!stale_path.exists());
+        assert!(!stale_meta_path.exists());
+    }
 }
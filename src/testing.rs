@@ -4,6 +4,7 @@ use crate::{RustRouteError, RustRouteResult};
 use std::net::Ipv4Addr;
 use std::time::{Duration, Instant};
 use tokio::net::TcpStream;
+use tokio::task::JoinSet;
 use tokio::time::timeout;
 
 /// Ping test results
@@ -30,36 +31,115 @@ pub async fn perform_connectivity_test(target_ip: Ipv4Addr) -> RustRouteResult<P
 
 /// Use system ping command
 async fn system_ping_test(target_ip: Ipv4Addr) -> RustRouteResult<PingTestResults> {
-    use std::process::Command;
+    use std::process::Stdio;
+    use tokio::io::AsyncReadExt;
+    use tokio::process::Command;
 
-    let output = Command::new("ping")
+    let mut child = Command::new("ping")
         .arg("-c")
         .arg("4") // 4 packets
         .arg("-W")
         .arg("2") // 2 second timeout
         .arg(target_ip.to_string())
-        .output()
+        .stdout(Stdio::piped())
+        .stderr(Stdio::piped())
+        .kill_on_drop(true)
+        .spawn()
         .map_err(|e| RustRouteError::NetworkError(format!("Failed to execute ping: {}", e)))?;
 
-    let stdout = String::from_utf8_lossy(&output.stdout);
-    parse_ping_output(&stdout)
+    let stdout = child
+        .stdout
+        .take()
+        .ok_or_else(|| RustRouteError::NetworkError("Failed to capture ping output".to_string()))?;
+    let mut stderr = child
+        .stderr
+        .take()
+        .ok_or_else(|| RustRouteError::NetworkError("Failed to capture ping errors".to_string()))?;
+
+    // Drain both pipes concurrently so a full stderr buffer can never stall ping
+    let mut parser = PingOutputParser::default();
+    let mut stderr_output = Vec::new();
+    let (stdout_result, stderr_result) = tokio::join!(
+        read_ping_output(stdout, &mut parser),
+        stderr.read_to_end(&mut stderr_output)
+    );
+    stdout_result?;
+    if let Err(e) = stderr_result {
+        log::warn!("Failed to read ping stderr: {}", e);
+    }
+
+    let status = child
+        .wait()
+        .await
+        .map_err(|e| RustRouteError::NetworkError(format!("Failed to wait for ping: {}", e)))?;
+
+    // ping exits non-zero for lost packets too; only treat it as a failure without a summary
+    if !status.success() && !parser.saw_summary {
+        let stderr_text = String::from_utf8_lossy(&stderr_output);
+        let message = if stderr_text.trim().is_empty() {
+            format!("ping exited with {}", status)
+        } else {
+            format!("ping exited with {}: {}", status, stderr_text.trim())
+        };
+        return Err(RustRouteError::NetworkError(message));
+    }
+
+    Ok(parser.finish())
 }
 
-/// Parse ping output
-fn parse_ping_output(output: &str) -> RustRouteResult<PingTestResults> {
-    let mut packets_sent = 4; // Default
-    let mut packets_received = 0;
-    let mut rtts = Vec::new();
+/// Feed ping stdout to the parser line by line as it arrives
+async fn read_ping_output(
+    stdout: tokio::process::ChildStdout,
+    parser: &mut PingOutputParser,
+) -> RustRouteResult<()> {
+    use tokio::io::{AsyncBufReadExt, BufReader};
+
+    // Lines are read as raw bytes into one reused buffer; localized ping output is not
+    // guaranteed to be UTF-8.
+    let mut reader = BufReader::new(stdout);
+    let mut line = Vec::new();
+    loop {
+        line.clear();
+        let read = reader.read_until(b'\n', &mut line).await.map_err(|e| {
+            RustRouteError::NetworkError(format!("Failed to read ping output: {}", e))
+        })?;
+        if read == 0 {
+            return Ok(());
+        }
+        parser.feed_line(String::from_utf8_lossy(&line).trim_end());
+    }
+}
+
+/// Incremental parser for ping output
+struct PingOutputParser {
+    packets_sent: u32,
+    packets_received: u32,
+    rtts: Vec<f64>,
+    saw_summary: bool,
+}
+
+impl Default for PingOutputParser {
+    fn default() -> Self {
+        Self {
+            packets_sent: 4, // Default
+            packets_received: 0,
+            rtts: Vec::new(),
+            saw_summary: false,
+        }
+    }
+}
 
-    for line in output.lines() {
+impl PingOutputParser {
+    /// Consume a single line of ping output
+    fn feed_line(&mut self, line: &str) {
         // Parse RTT from ping responses
         if line.contains("time=") {
             if let Some(time_start) = line.find("time=") {
                 let time_part = &line[time_start + 5..];
                 if let Some(space_pos) = time_part.find(' ') {
                     if let Ok(rtt) = time_part[..space_pos].parse::<f64>() {
-                        rtts.push(rtt);
-                        packets_received += 1;
+                        self.rtts.push(rtt);
+                        self.packets_received += 1;
                     }
                 }
             }
@@ -69,35 +149,43 @@ fn parse_ping_output(output: &str) -> RustRouteResult<PingTestResults> {
         if line.contains("packets transmitted") && line.contains("received") {
             let parts: Vec<&str> = line.split_whitespace().collect();
             if parts.len() >= 4 {
-                packets_sent = parts[0].parse().unwrap_or(4);
-                packets_received = parts[3].parse().unwrap_or(0);
+                self.packets_sent = parts[0].parse().unwrap_or(4);
+                self.packets_received = parts[3].parse().unwrap_or(0);
+                self.saw_summary = true;
             }
         }
     }
 
-    let packet_loss_percent = if packets_sent > 0 {
-        ((packets_sent - packets_received) as f64 / packets_sent as f64) * 100.0
-    } else {
-        100.0
-    };
+    /// Build the final results from the lines seen so far
+    fn finish(self) -> PingTestResults {
+        let packets_sent = self.packets_sent;
+        let packets_received = self.packets_received;
+        let rtts = self.rtts;
 
-    let (avg_rtt_ms, min_rtt_ms, max_rtt_ms) = if !rtts.is_empty() {
-        let avg = rtts.iter().sum::<f64>() / rtts.len() as f64;
-        let min = rtts.iter().fold(f64::INFINITY, |a, &b| a.min(b));
-        let max = rtts.iter().fold(0.0f64, |a, &b| a.max(b));
-        (avg, min, max)
-    } else {
-        (0.0, 0.0, 0.0)
-    };
+        let packet_loss_percent = if packets_sent > 0 {
+            ((packets_sent - packets_received) as f64 / packets_sent as f64) * 100.0
+        } else {
+            100.0
+        };
 
-    Ok(PingTestResults {
-        packets_sent,
-        packets_received,
-        packet_loss_percent,
-        avg_rtt_ms,
-        min_rtt_ms,
-        max_rtt_ms,
-    })
+        let (avg_rtt_ms, min_rtt_ms, max_rtt_ms) = if !rtts.is_empty() {
+            let avg = rtts.iter().sum::<f64>() / rtts.len() as f64;
+            let min = rtts.iter().fold(f64::INFINITY, |a, &b| a.min(b));
+            let max = rtts.iter().fold(0.0f64, |a, &b| a.max(b));
+            (avg, min, max)
+        } else {
+            (0.0, 0.0, 0.0)
+        };
+
+        PingTestResults {
+            packets_sent,
+            packets_received,
+            packet_loss_percent,
+            avg_rtt_ms,
+            min_rtt_ms,
+            max_rtt_ms,
+        }
+    }
 }
 
 /// TCP connectivity test as fallback
@@ -106,14 +194,22 @@ async fn tcp_connectivity_test(target_ip: Ipv4Addr) -> RustRouteResult<PingTestR
     let mut rtts = Vec::new();
     let test_ports = [80, 443, 22, 53]; // Common ports
 
+    // Probe all ports concurrently so the worst case is one timeout, not one per port
+    let mut probes = JoinSet::new();
     for &port in &test_ports {
         let addr = std::net::SocketAddr::new(std::net::IpAddr::V4(target_ip), port);
 
-        let start_time = Instant::now();
-        let connect_result = timeout(Duration::from_secs(2), TcpStream::connect(addr)).await;
+        probes.spawn(async move {
+            let start_time = Instant::now();
+            match timeout(Duration::from_secs(2), TcpStream::connect(addr)).await {
+                Ok(Ok(_)) => Some(start_time.elapsed().as_secs_f64() * 1000.0),
+                _ => None,
+            }
+        });
+    }
 
-        if connect_result.is_ok() && connect_result.unwrap().is_ok() {
-            let rtt = start_time.elapsed().as_secs_f64() * 1000.0;
+    while let Some(result) = probes.join_next().await {
+        if let Ok(Some(rtt)) = result {
             successful_connections += 1;
             rtts.push(rtt);
         }
@@ -173,3 +269,33 @@ pub fn get_diagnosis_suggestions(target_ip: Ipv4Addr) -> Vec<String> {
 
     suggestions
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn ping_parser_reads_replies_and_summary() {
+        let mut parser = PingOutputParser::default();
+        parser.feed_line("64 bytes from 127.0.0.1: icmp_seq=1 ttl=64 time=0.042 ms");
+        parser.feed_line("64 bytes from 127.0.0.1: icmp_seq=2 ttl=64 time=0.058 ms");
+        parser.feed_line("2 packets transmitted, 2 received, 0% packet loss, time 1001ms");
+        assert!(parser.saw_summary);
+
+        let results = parser.finish();
+        assert_eq!(results.packets_sent, 2);
+        assert_eq!(results.packets_received, 2);
+        assert_eq!(results.packet_loss_percent, 0.0);
+        assert!((results.max_rtt_ms - 0.058).abs() < f64::EPSILON);
+    }
+
+    #[test]
+    fn ping_parser_without_summary_keeps_defaults() {
+        let parser = PingOutputParser::default();
+        assert!(!parser.saw_summary);
+
+        let results = parser.finish();
+        assert_eq!(results.packets_sent, 4);
+        assert_eq!(results.packet_loss_percent, 100.0);
+    }
+}
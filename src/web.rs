@@ -281,20 +281,19 @@ async fn get_system_status(
     headers: HeaderMap,
 ) -> Result<Json<ApiResponse<SystemStatus>>, StatusCode> {
     ensure_permission(&state, Some(&headers), None, Some(UserRole::ReadOnly)).await?;
-    let router_stats = {
+    // Take a single router read lock for both the statistics and the config view
+    let (router_stats, config) = {
         let router_guard = state.router.read().await;
-        router_guard.statistics().await
+        (
+            router_guard.statistics().await,
+            router_guard.config_snapshot(),
+        )
     };
 
     let metrics_snapshot = state
         .metrics
         .snapshot(router_stats.neighbor_count, router_stats.route_count);
 
-    let config = {
-        let router_guard = state.router.read().await;
-        router_guard.config_snapshot()
-    };
-
     let interfaces = collect_interface_info(&config.interfaces).await;
     let cpu_usage = cpu_usage_percent().await;
 
@@ -653,26 +652,79 @@ async fn collect_interface_info(interfaces: &[InterfaceConfig]) -> Vec<Interface
         .collect()
 }
 
+/// Minimum gap between two `/proc/stat` reads for a meaningful CPU usage delta
+const CPU_SAMPLE_WINDOW: Duration = Duration::from_millis(150);
+
+/// Last `/proc/stat` sample, used as the baseline for the next status poll
+#[derive(Clone, Copy)]
+struct CpuSample {
+    idle: u64,
+    total: u64,
+    usage: f32,
+    taken_at: tokio::time::Instant,
+}
+
+static LAST_CPU_SAMPLE: std::sync::Mutex<Option<CpuSample>> = std::sync::Mutex::new(None);
+
 async fn cpu_usage_percent() -> f32 {
-    let first = read_cpu_times();
-    tokio::time::sleep(Duration::from_millis(150)).await;
-    let second = read_cpu_times();
-
-    match (first, second) {
-        (Some((idle1, total1)), Some((idle2, total2))) if total2 > total1 && idle2 >= idle1 => {
-            let total_delta = total2 - total1;
-            let idle_delta = idle2 - idle1;
-            if total_delta == 0 {
-                0.0
-            } else {
-                let usage = (total_delta - idle_delta) as f32 / total_delta as f32;
-                (usage * 100.0).clamp(0.0, 100.0)
-            }
+    sample_cpu_usage(&LAST_CPU_SAMPLE).await
+}
+
+async fn sample_cpu_usage(slot: &std::sync::Mutex<Option<CpuSample>>) -> f32 {
+    let previous = slot.lock().ok().and_then(|guard| *guard);
+
+    // Polls arriving within one window of the last sample reuse its reading; a shorter
+    // window holds too few jiffies to give anything but a quantized 0/50/100%.
+    if let Some(sample) = previous {
+        if sample.taken_at.elapsed() < CPU_SAMPLE_WINDOW {
+            return sample.usage;
         }
-        _ => 0.0,
+    }
+
+    let baseline = match previous {
+        Some(sample) => Some((sample.idle, sample.total)),
+        None => {
+            let first = read_cpu_times();
+            tokio::time::sleep(CPU_SAMPLE_WINDOW).await;
+            first
+        }
+    };
+    let current = read_cpu_times();
+
+    match (baseline, current) {
+        (Some(baseline), Some(current)) => match cpu_usage_between(baseline, current) {
+            Some(usage) => {
+                if let Ok(mut guard) = slot.lock() {
+                    *guard = Some(CpuSample {
+                        idle: current.0,
+                        total: current.1,
+                        usage,
+                        taken_at: tokio::time::Instant::now(),
+                    });
+                }
+                usage
+            }
+            // No CPU time elapsed since the baseline; keep it and report the previous reading
+            None => previous.map(|sample| sample.usage).unwrap_or(0.0),
+        },
+        _ => previous.map(|sample| sample.usage).unwrap_or(0.0),
     }
 }
 
+/// CPU usage in percent between two `(idle, total)` jiffy samples, if any time elapsed
+fn cpu_usage_between(previous: (u64, u64), current: (u64, u64)) -> Option<f32> {
+    let (idle1, total1) = previous;
+    let (idle2, total2) = current;
+    if total2 <= total1 || idle2 < idle1 {
+        return None;
+    }
+
+    let total_delta = total2 - total1;
+    let idle_delta = (idle2 - idle1).min(total_delta);
+    let usage = (total_delta - idle_delta) as f32 / total_delta as f32;
+    Some((usage * 100.0).clamp(0.0, 100.0))
+}
+
 #[derive(Default)]
 struct NetStats {
     rx_bytes: u64,
@@ -767,4 +819,57 @@ mod tests {
         assert_eq!(results.len(), 1);
         assert_eq!(results[0].name, "lo");
     }
+
+    #[test]
+    fn cpu_usage_between_computes_delta() {
+        assert_eq!(cpu_usage_between((100, 1000), (150, 1100)), Some(50.0));
+        assert_eq!(cpu_usage_between((100, 1000), (200, 1100)), Some(0.0));
+        assert_eq!(cpu_usage_between((100, 1000), (100, 1100)), Some(100.0));
+        assert_eq!(cpu_usage_between((100, 1000), (100, 1000)), None);
+        assert_eq!(cpu_usage_between((100, 1000), (90, 1100)), None);
+    }
+
+    #[tokio::test(start_paused = true)]
+    async fn cpu_usage_reuses_recent_sample() {
+        let slot = std::sync::Mutex::new(Some(CpuSample {
+            idle: 0,
+            total: 0,
+            usage: 42.0,
+            taken_at: tokio::time::Instant::now(),
+        }));
+
+        // A poll a few ms after the last one must not re-sample over a near-zero delta
+        tokio::time::advance(Duration::from_millis(5)).await;
+        assert_eq!(sample_cpu_usage(&slot).await, 42.0);
+        assert_eq!(slot.lock().unwrap().unwrap().usage, 42.0);
+    }
+
+    #[tokio::test(start_paused = true)]
+    async fn cpu_usage_skips_sampling_window_with_baseline() {
+        let Some((idle, total)) = read_cpu_times() else {
+            return; // no /proc/stat on this platform
+        };
+        let slot = std::sync::Mutex::new(Some(CpuSample {
+            idle,
+            total,
+            usage: 42.0,
+            taken_at: tokio::time::Instant::now(),
+        }));
+        tokio::time::advance(CPU_SAMPLE_WINDOW * 2).await;
+
+        let start = tokio::time::Instant::now();
+        let usage = sample_cpu_usage(&slot).await;
+        assert_eq!(start.elapsed(), Duration::ZERO);
+        assert!((0.0..=100.0).contains(&usage));
+    }
+
+    #[tokio::test(start_paused = true)]
+    async fn cpu_usage_samples_window_without_baseline() {
+        let slot = std::sync::Mutex::new(None);
+
+        let start = tokio::time::Instant::now();
+        let usage = sample_cpu_usage(&slot).await;
+        assert!(start.elapsed() >= CPU_SAMPLE_WINDOW);
+        assert!((0.0..=100.0).contains(&usage));
+    }
 }